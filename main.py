@@ -1,27 +1,43 @@
 from res import *
-import readline
 import os
+import sys
 import atexit
 
+# Persistent command history across runs (interactive sessions only)
+history_file = os.path.expanduser("~/.k8s_mock_exam_history")
 
-def main():
-    # Enable persistent command history across runs
-    history_file = os.path.expanduser("~/.k8s_mock_exam_history")
-
-    # Load history if the file exists
-    try:
-        readline.read_history_file(history_file)
-    except FileNotFoundError:
-        pass  # No history file yet, ignore error
 
-    # Save history on exit
-    atexit.register(readline.write_history_file, history_file)
-
-    # Enable advanced CLI features like arrow key navigation, shortcuts
-    readline.parse_and_bind("tab: complete")  # Tab for auto-completion (if applicable)
-    readline.parse_and_bind(
-        "set editing-mode emacs"
-    )  # Default line editing (bash-like)
+def main():
+    # Line editing and history only matter at a terminal; piped/scripted
+    # runs skip the readline setup and its history file I/O entirely
+    readline = None
+    if sys.stdin.isatty():
+        try:
+            import readline
+        except ImportError:
+            pass  # No readline on this platform (e.g. Windows): plain input()
+
+    if readline is not None:
+        # Load history if the file exists
+        try:
+            readline.read_history_file(history_file)
+        except FileNotFoundError:
+            pass  # No history file yet, ignore error
+
+        # Save history on exit, capped so the file (and the next load) stays small
+        readline.set_history_length(1000)
+        atexit.register(readline.write_history_file, history_file)
+
+        # Enable advanced CLI features like arrow key navigation, shortcuts
+        # Tab for auto-completion (if applicable)
+        readline.parse_and_bind("tab: complete")
+        readline.parse_and_bind(
+            "set editing-mode emacs"
+        )  # Default line editing (bash-like)
+
+    # Reuse syntax checks that passed in earlier runs, and save this run's
+    load_syntax_cache()
+    atexit.register(save_syntax_cache)
 
     print(
         "Welcome to the K8s Mock Exam with syntax check for kubectl, kubeadm, and bash!"
@@ -32,39 +48,34 @@ def main():
 
     for i, qa in enumerate(Q_AND_A, start=1):
         print(f"\nQuestion {i}:")
-        print(qa["question"])
+        print(qa.question)
 
         # Handle commands for this question (with immediate feedback if needed)
         user_cmds = get_user_commands_with_syntax_check(
-            question_id=qa.get("special_handling")
+            special_handling=qa.special_handling
         )
         final_answer = "\n".join(user_cmds)
 
-        print("\n=== Checking Your Answer ===")
+        # Render each block into one string and write it in a single call
+        out = ["\n=== Checking Your Answer ===\n"]
 
         # Compare the user's answers against expected checklist
-        found, missing = check_against_checklist(final_answer, qa["checklist"])
+        found, missing = check_against_checklist(
+            final_answer, qa.checklist, qa.checklist_folded
+        )
         if missing:
-            print("You might be missing these key parts:")
-            for m in missing:
-                print(f"  - {m}")
+            out.append("You might be missing these key parts:\n")
+            out.extend(f"  - {m}\n" for m in missing)
         else:
-            print("Looks like you included all the key parts we expect!")
+            out.append("Looks like you included all the key parts we expect!\n")
+        sys.stdout.write("".join(out))
 
         # Handle special cases, e.g., Q10 (mock outputs for missing pipes/filters)
-        if qa.get("special_handling") == "q10":
-            special_mock_output_q10(final_answer)
-
-        # Display reference answer for comparison
-        print("\n--- Reference Answer (for comparison) ---")
-        print(qa["reference"])
-
-        if qa.get("notes"):
-            print("\nNotes:")
-            for note in qa["notes"]:
-                print(f"  - {note}")
+        if qa.special_handling is not None:
+            qa.special_handling(final_answer)
 
-        print("-" * 70, "\n")
+        # Display reference answer (and notes) for comparison
+        sys.stdout.write(qa.footer)
 
     print("All questions done! Good luck with your Kubernetes journey.\n")
 
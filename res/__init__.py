@@ -5,6 +5,31 @@ from .checks import (
     get_user_commands_with_syntax_check,
     check_against_checklist,
     special_mock_output_q10,
+    load_syntax_cache,
+    save_syntax_cache,
 )
 
-from .q_and_a import Q_AND_A
+from .q_and_a import QA
+
+__all__ = [
+    "canonicalize_kubectl",
+    "run_help_command",
+    "syntax_check_cli",
+    "get_user_commands_with_syntax_check",
+    "check_against_checklist",
+    "special_mock_output_q10",
+    "load_syntax_cache",
+    "save_syntax_cache",
+    "QA",
+    "Q_AND_A",
+]
+
+
+def __getattr__(name: str):
+    # Q_AND_A is loaded lazily (see res.q_and_a); star imports still get it
+    # because it is listed in __all__
+    if name == "Q_AND_A":
+        from .q_and_a import Q_AND_A
+
+        return Q_AND_A
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
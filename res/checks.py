@@ -1,10 +1,14 @@
-import re
-import subprocess
+import json
 import os
-import atexit
+import shelve
+import shlex
+import shutil
+import sys
+from functools import lru_cache
 
 # Define alias mappings
 ALIASES = {
+    "k": "kubectl",
     "sa": "serviceaccount",
     "ds": "daemonset",
     "sts": "statefulset",
@@ -14,23 +18,102 @@ ALIASES = {
     "pvc": "persistentvolumeclaim",
 }
 
-# Enable persistent history
-history_file = os.path.expanduser("~/.k8s_mock_exam_history")
-try:
-    import readline
-
-    readline.read_history_file(history_file)
-except (FileNotFoundError, ImportError):
-    pass
-
-atexit.register(lambda: readline.write_history_file(history_file))
-
-# Enable CLI features
-try:
-    readline.parse_and_bind("tab: complete")
-    readline.parse_and_bind("set editing-mode emacs")
-except NameError:
-    pass
+# Characters that need a real shell (redirects, globs, expansions, lists)
+_SHELL_ONLY_CHARS = frozenset("<>&;$`*?~(){}[]!#")
+
+# Commands whose lines are syntax-checked before being accepted
+_CHECKED_COMMANDS = frozenset({"kubectl", "kubeadm", "apt-get", "systemctl"})
+
+# kubectl subcommands that need no syntax check round-trip
+_CLIENT_ONLY_SUBCOMMANDS = frozenset(
+    {"explain", "api-resources", "api-versions", "options", "version", "config"}
+)
+
+# kubectl verbs that accept --dry-run, so they can be checked without
+# touching cluster state
+_DRY_RUNNABLE_VERBS = frozenset(
+    {
+        "create",
+        "delete",
+        "apply",
+        "patch",
+        "replace",
+        "run",
+        "expose",
+        "scale",
+        "autoscale",
+        "label",
+        "annotate",
+    }
+)
+
+# kubectl verbs whose client-side dry run builds the object from the
+# arguments alone; flags that make them read a manifest instead
+_GENERATOR_VERBS = frozenset({"create", "run"})
+_MANIFEST_FLAG_PREFIXES = ("-f=", "-k=", "--filename", "--kustomize")
+
+# 'kubectl run' options that attach to the Pod; kubectl rejects them
+# together with --dry-run, so such commands are checked as typed
+_RUN_ATTACH_FLAGS = frozenset(
+    {"-i", "-t", "-it", "-ti", "--stdin", "--tty", "--attach", "--rm"}
+)
+
+# Rule printed under the help command banner
+_SEP = "-" * 40
+
+# Q10 mock outputs, shown when pipes/filters are missing
+_Q10_NODES_HEADER = "NAME         STATUS     ROLES    AGE   VERSION\n"
+_Q10_MASTER_READY = "k8s-master   Ready      master   12d   v1.19.0\n"
+_Q10_NODE_NOT_READY = "wk8s-node-0  NotReady   <none>   11d   v1.19.0\n"
+_Q10_RAW_NODES = (
+    "[MOCK OUTPUT] You might be missing pipes or filters. Example raw output:\n\n"
+    + _Q10_NODES_HEADER
+    + _Q10_MASTER_READY
+    + _Q10_NODE_NOT_READY
+    + "\n"
+)
+_Q10_FILTERED_NODES = (
+    "[MOCK OUTPUT] Example filtered output:\n\n"
+    + _Q10_NODES_HEADER
+    + _Q10_MASTER_READY
+    + "\n"
+)
+_Q10_MISSING_READY = (
+    "[MOCK OUTPUT] Missing '| grep -i ready'. Example output:\n\n"
+    + _Q10_NODES_HEADER
+    + _Q10_MASTER_READY
+    + _Q10_NODE_NOT_READY
+    + "\n"
+)
+_Q10_MISSING_NOSCHED = (
+    "[MOCK OUTPUT] Missing '| grep -i noSchedule'. Example taints:\n\n"
+    "Taints: node-role.kubernetes.io/master:NoSchedule\n\n"
+)
+
+# Syntax-check verdicts for this session: argv tuple -> (is_ok, error text),
+# kept only for replayable dry runs (see _is_replayable_check)
+_syntax_cache = {}
+
+# Successful syntax checks persisted across runs (most recent entries only)
+syntax_cache_file = os.path.expanduser("~/.k8s_mock_exam_syntax_cache")
+_SYNTAX_CACHE_LIMIT = 512
+
+# Help output cached across runs (keyed by binary + argv)
+help_cache_file = os.path.expanduser("~/.cache/ckamock/help")
+
+
+def _split_command(cmd: str) -> list:
+    """
+    Split a command line into argv tokens.
+    Plain str.split() covers almost every line; shlex is only used when the
+    line contains quotes or escapes (e.g. --from-literal='a b').
+    """
+    if "'" not in cmd and '"' not in cmd and "\\" not in cmd:
+        return cmd.split()
+    try:
+        return shlex.split(cmd)
+    except ValueError:  # unbalanced quotes: let the CLI report it
+        return cmd.split()
 
 
 def replace_aliases(cmd: str) -> str:
@@ -38,61 +121,427 @@ def replace_aliases(cmd: str) -> str:
     Replace aliases in the command with their full forms based on ALIASES.
     Example: 'k create sa' -> 'kubectl create serviceaccount'
     """
-    tokens = cmd.strip().split()
-    for i, token in enumerate(tokens):
-        if token in ALIASES:
-            tokens[i] = ALIASES[token]
-    return " ".join(tokens)
+    # One dict probe per token; split() already drops surrounding whitespace
+    return " ".join([ALIASES.get(token, token) for token in cmd.split()])
 
 
 def canonicalize_kubectl(cmd: str) -> str:
     """
     Replace 'k' with 'kubectl' and process any aliases.
+    'k' is just another entry in ALIASES, so this is a single token pass.
+    """
+    return replace_aliases(cmd)
+
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str):
+    """
+    Resolve an executable on PATH once per session.
+    Returns the absolute path, or None if the command is not installed.
+    """
+    return shutil.which(name)
+
+
+def _help_cache_key(argv: tuple) -> str:
+    """
+    Key help output on the exact binary (path + mtime) and argv, so an
+    upgraded kubectl/kubeadm never serves stale text.
     """
-    cmd = re.sub(r"\bk\b", "kubectl", cmd)  # Replace 'k' with 'kubectl'
-    cmd = replace_aliases(cmd)  # Handle custom aliases
-    return cmd
+    mtime = os.stat(argv[0]).st_mtime_ns
+    return "\0".join((*argv, str(mtime)))
 
 
-def run_help_command(cmd: str):
+@lru_cache(maxsize=128)
+def _help_output(argv: tuple):
+    """
+    Run a help command and return its (stdout, stderr).
+    Help text only depends on the binary and argv, so repeated lookups
+    are served from memory, then from the on-disk cache, and only spawn
+    the CLI when neither has it.
+    """
+    import subprocess  # deferred: only needed once a command is run
+
+    key = _help_cache_key(argv)
+    try:
+        with shelve.open(help_cache_file) as cache:
+            if key in cache:
+                return cache[key]
+    except Exception:
+        pass  # The disk cache is best-effort; fall back to running the CLI
+
+    result = subprocess.run(list(argv), capture_output=True, text=True)
+    output = (result.stdout, result.stderr)
+    try:
+        os.makedirs(os.path.dirname(help_cache_file), exist_ok=True)
+        with shelve.open(help_cache_file) as cache:
+            cache[key] = output
+    except Exception:
+        pass
+    return output
+
+
+def run_help_command(cmd: str, tokens=None):
     """
     Run 'kubectl ... --help' or 'kubeadm ... --help' and display output.
+    The output is shown only; it is never stored in the final answer.
+    Pass tokens if the caller has already split cmd, and timed_out with
+    the argvs that already timed out in a prefetch of the same block.
     """
-    tokens = cmd.strip().split()
-    print(f"\n[Help Command]: {cmd}\n{'-'*40}")
+    if tokens is None:
+        tokens = _split_command(cmd)
+    print(f"\n[Help Command]: {cmd}\n{_SEP}")
+    executable = _resolve_executable(tokens[0])
+    if executable is None:
+        print("[ERROR] Command not found.")
+        return
     try:
-        result = subprocess.run(tokens, capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
+        stdout, stderr = _help_output((executable, *tokens[1:]))
+        if stdout:
+            print(stdout)
+        if stderr:
+            print(stderr)
     except FileNotFoundError:
         print("[ERROR] Command not found.")
     except Exception as e:
         print(f"[ERROR] {e}")
 
 
-def syntax_check_cli(cmd: str, timeout_secs: int = 2) -> bool:
+def _is_client_dry_run(argv) -> bool:
+    """
+    True for a kubectl argv with --dry-run=client right after the verb,
+    where _syntax_check_tokens() puts it. Such a check never changes the
+    cluster, but verbs like delete, scale, label or apply still read the
+    live objects, so their verdict can depend on cluster state.
+    """
+    return (
+        len(argv) > 2
+        and os.path.basename(argv[0]) == "kubectl"
+        and argv[2] == "--dry-run=client"
+    )
+
+
+def _is_replayable_check(argv) -> bool:
+    """
+    True for a client-side dry run whose verdict depends only on the binary
+    and the argv: generator-style 'create'/'run' that reads no manifest
+    (-f/-k), so it never looks at the cluster or a file.
+    """
+    if not _is_client_dry_run(argv) or argv[1] not in _GENERATOR_VERBS:
+        return False
+    for t in argv[3:]:
+        if t in ("-f", "-k") or t.startswith(_MANIFEST_FLAG_PREFIXES):
+            return False
+    return True
+
+
+def load_syntax_cache():
+    """
+    Seed the session's syntax-check cache with replayable dry runs (see
+    _is_replayable_check) that passed in earlier runs. Entries recorded
+    against a binary that has changed since (different mtime) are ignored.
+    """
+    try:
+        with open(syntax_cache_file) as f:
+            entries = json.load(f)
+        for argv, mtime in entries:
+            if not _is_replayable_check(argv):
+                continue  # e.g. written by an older version
+            try:
+                if os.stat(argv[0]).st_mtime_ns != mtime:
+                    continue
+            except OSError:
+                continue  # Binary gone: drop just this entry
+            _syntax_cache[tuple(argv)] = (True, "")
+    except (OSError, ValueError, TypeError, IndexError):
+        pass  # Missing or unreadable cache: start cold
+
+
+def save_syntax_cache():
+    """
+    Persist this session's successful replayable dry runs for the next run.
+    Failures, and commands whose result depends on the cluster, host or a
+    manifest (cordon, drain, delete, apply -f, apt-get, ...), are not saved,
+    so their verdict is never replayed later.
+    """
+    entries = []
+    for argv, (is_ok, _) in _syntax_cache.items():
+        if not is_ok or not _is_replayable_check(argv):
+            continue
+        try:
+            entries.append([list(argv), os.stat(argv[0]).st_mtime_ns])
+        except OSError:
+            continue
+    try:
+        with open(syntax_cache_file, "w") as f:
+            json.dump(entries[-_SYNTAX_CACHE_LIMIT:], f)
+    except OSError:
+        pass
+
+
+def _scan_flags(tokens: list):
+    """
+    Single pass over the tokens of a kubectl command.
+    Returns (has_dry_run, has_output).
+    """
+    has_dry_run = has_output = False
+    for t in tokens:
+        if t.startswith("--dry-run"):
+            has_dry_run = True
+        elif t == "-o" or t.startswith("--output"):
+            has_output = True
+        if has_dry_run and has_output:
+            break
+    return has_dry_run, has_output
+
+
+def _has_attach_flag(tokens: list) -> bool:
+    """
+    True if a 'kubectl run' command asks to attach (-it, --rm, ...).
+    Tokens after '--' belong to the container command and are ignored.
+    """
+    for t in tokens:
+        if t == "--":
+            break
+        if t.split("=", 1)[0] in _RUN_ATTACH_FLAGS:
+            return True
+    return False
+
+
+def _pipeline_segments(cmd: str):
+    """
+    Split a plain 'a | b | c' pipeline into one argv list per stage.
+    Returns None when the line needs a real shell (redirects, globs,
+    expansions, '||', unbalanced quotes, ...).
+    """
+    if any(c in _SHELL_ONLY_CHARS for c in cmd):
+        return None
+    lexer = shlex.shlex(cmd, posix=True, punctuation_chars="|")
+    lexer.whitespace_split = True
+    segments = [[]]
+    try:
+        for token in lexer:
+            if token == "|":
+                segments.append([])
+            elif token.strip("|") == "":
+                return None  # '||' and friends
+            else:
+                segments[-1].append(token)
+    except ValueError:
+        return None
+    if len(segments) < 2 or not all(segments):
+        return None
+    return segments
+
+
+def _run_pipeline(segments: list, timeout_secs: int):
+    """
+    Run a pipeline without spawning /bin/sh in front of it.
+    Returns (returncode, stdout, stderr) the way the shell would: the exit
+    status of the last stage, and stderr collected from every stage.
+    """
+    import subprocess
+    import tempfile
+
+    procs = []
+    prev_stdout = None
+    # One shared file for stderr, so a chatty early stage can never block
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            for argv in segments:
+                try:
+                    proc = subprocess.Popen(
+                        argv,
+                        stdin=prev_stdout,
+                        stdout=subprocess.PIPE,
+                        stderr=stderr_file,
+                    )
+                except FileNotFoundError:
+                    # Name the missing stage, like the shell's exit status 127
+                    return 127, "", f"{argv[0]}: command not found"
+                if prev_stdout is not None:
+                    prev_stdout.close()  # let the upstream stage see SIGPIPE
+                prev_stdout = proc.stdout
+                procs.append(proc)
+
+            stdout, _ = procs[-1].communicate(timeout=timeout_secs)
+            for proc in procs[:-1]:
+                proc.wait(timeout=timeout_secs)
+        finally:
+            # Still open if a later stage failed to start
+            if prev_stdout is not None:
+                prev_stdout.close()
+            for proc in procs:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    return (
+        procs[-1].returncode,
+        stdout.decode("utf-8", "replace"),
+        stderr.decode("utf-8", "replace"),
+    )
+
+
+def _syntax_check_tokens(tokens: list):
+    """
+    Return the argv tokens to run for a syntax check, or None when the
+    command is accepted without running anything.
+    """
+    # Only the command name and verb decide the handling below, so compare
+    # those instead of lowercasing the whole line
+    head = tokens[0].lower() if tokens else ""
+    verb = tokens[1] if len(tokens) >= 2 else ""
+
+    # Client-side/informational subcommands: accept without spawning kubectl
+    if head == "kubectl" and verb in _CLIENT_ONLY_SUBCOMMANDS:
+        return None
+
+    # Insert --dry-run=client and -o yaml for verbs that support a dry run
+    if (
+        head == "kubectl"
+        and verb in _DRY_RUNNABLE_VERBS
+        and not (verb == "run" and _has_attach_flag(tokens))
+    ):
+        has_dry_run, has_output = _scan_flags(tokens)
+        extra = []
+        if not has_dry_run:
+            extra.append("--dry-run=client")
+        if not has_output:
+            extra += ["-o", "yaml"]
+        if extra:
+            tokens = tokens[:2] + extra + tokens[2:]
+    return tokens
+
+
+def _run_syntax_check(argv: tuple, timeout_secs: int, timed_out=()):
+    """
+    Run one syntax check and return (is_ok, error text), without printing.
+    Only replayable dry runs (see _is_replayable_check) are cached; every
+    other command really runs, so it is run again each time it is entered.
+    Argvs in timed_out (timed out in this block's prefetch) are not run
+    again. Subprocess errors are left to the caller.
+    """
+    import subprocess
+
+    # Same argv already checked this session: reuse the verdict
+    cached = _syntax_cache.get(argv)
+    if cached is not None:
+        return cached
+    # Already timed out in the prefetch: don't wait on it a second time
+    if argv in timed_out:
+        raise subprocess.TimeoutExpired(argv, timeout_secs)
+
+    # stdout (e.g. dry-run YAML) is never shown, so don't collect it
+    result = subprocess.run(
+        argv,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        timeout=timeout_secs,
+    )
+    is_ok = result.returncode == 0
+    # Output is only decoded when there is an error to show
+    error = "" if is_ok else result.stderr.decode("utf-8", "replace").strip()
+    # Only completed runs are cached; errors such as a missing binary are retried
+    if _is_replayable_check(argv):
+        _syntax_cache[argv] = (is_ok, error)
+    return is_ok, error
+
+
+def _prefetch_syntax_checks(lines: list, timeout_secs: int = 2):
+    """
+    Warm _syntax_cache for a batch of piped lines by running their checks
+    in parallel threads. Nothing is printed here; the lines are still
+    processed (and reported) one by one afterwards.
+    Only replayable dry runs are prefetched, since only their verdicts are
+    cached; every other check really runs the command (cordon, drain,
+    apt-get, ...), so those keep their order and run once, in the
+    sequential pass.
+    Returns the argvs that timed out, for that block's sequential pass.
+    """
+    import subprocess
+
+    argvs = []
+    for line in lines:
+        tokens = _split_command(canonicalize_kubectl(line))
+        if not tokens or tokens[0].lower() not in _CHECKED_COMMANDS:
+            continue
+        # Help and shell lines print their output as they run, so skip them
+        if "--help" in tokens or "|" in line or ">" in line:
+            continue
+        tokens = _syntax_check_tokens(tokens)
+        if tokens is None:
+            continue
+        executable = _resolve_executable(tokens[0])
+        if executable is None:
+            continue
+        argv = (executable, *tokens[1:])
+        if not _is_replayable_check(argv) or argv in _syntax_cache:
+            continue
+        if argv not in argvs:
+            argvs.append(argv)
+
+    if len(argvs) < 2:
+        return frozenset()
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def warm(argv):
+        try:
+            _run_syntax_check(argv, timeout_secs)
+        except subprocess.TimeoutExpired:
+            return argv
+        except Exception:
+            pass  # reported again by the sequential pass
+        return None
+
+    # The threads only wait on subprocesses, so the GIL is not a bottleneck
+    with ThreadPoolExecutor(max_workers=min(8, len(argvs))) as pool:
+        return frozenset(argv for argv in pool.map(warm, argvs) if argv)
+
+
+def syntax_check_cli(
+    cmd: str, timeout_secs: int = 2, tokens=None, timed_out=()
+) -> bool:
     """
     Syntax-check commands for kubectl, kubeadm, and bash-like commands.
-    Handles pipes and redirects by enabling shell execution.
+    Plain pipelines run without a shell (see _run_pipeline); redirects and
+    other shell syntax fall back to shell execution.
+    Pass tokens if the caller has already split cmd, and timed_out with
+    the argvs that already timed out in a prefetch of the same block.
     """
+    import subprocess  # deferred: only needed once a command is run
+
     # Check if the command includes pipes or redirects
     if "|" in cmd or ">" in cmd:
-        # Shell execution to support pipes and redirections
         print(f"[Shell Execution]: {cmd}")
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=timeout_secs
-            )
+            segments = _pipeline_segments(cmd)
+            if segments is not None:
+                # Plain 'a | b' pipeline: connect the processes ourselves
+                returncode, stdout, stderr = _run_pipeline(segments, timeout_secs)
+            else:
+                # Shell execution to support redirections and other syntax
+                result = subprocess.run(
+                    cmd,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout_secs,
+                )
+                returncode = result.returncode
+                stdout, stderr = result.stdout, result.stderr
+
             # Print captured output for visibility
-            if result.stdout:
-                print(result.stdout.strip())
-            if result.stderr:
-                print(result.stderr.strip())
+            if stdout:
+                print(stdout.strip())
+            if stderr:
+                print(stderr.strip())
 
             # Check for errors
-            if result.returncode != 0:
+            if returncode != 0:
                 return False
             return True
         except subprocess.TimeoutExpired:
@@ -106,27 +555,25 @@ def syntax_check_cli(cmd: str, timeout_secs: int = 2) -> bool:
             return False
 
     # Continue normal processing for non-shell commands
-    tokens = cmd.strip().split()
-    lower_cmd = cmd.lower()
-
-    # Insert --dry-run=client and -o yaml for 'create' or 'delete'
-    if lower_cmd.startswith("kubectl "):
-        if len(tokens) >= 2 and tokens[1] in ["create", "delete"]:
-            if not any(t.startswith("--dry-run") for t in tokens):
-                tokens.insert(2, "--dry-run=client")
-            if not any(t == "-o" or t.startswith("--output") for t in tokens):
-                tokens.insert(3, "-o")
-                tokens.insert(4, "yaml")
+    if tokens is None:
+        tokens = _split_command(cmd)
+    tokens = _syntax_check_tokens(tokens)
+    if tokens is None:
+        return True
 
     print(f"[Syntax-checking]: {' '.join(tokens)}")
+    executable = _resolve_executable(tokens[0])
+    if executable is None:
+        print("[ERROR] Command not found.\n")
+        return False
+
     try:
-        result = subprocess.run(
-            tokens, capture_output=True, text=True, timeout=timeout_secs
+        is_ok, error = _run_syntax_check(
+            (executable, *tokens[1:]), timeout_secs, timed_out
         )
-        if result.returncode != 0:
-            print(result.stderr.strip())
-            return False
-        return True
+        if not is_ok:
+            print(error)
+        return is_ok
     except subprocess.TimeoutExpired:
         print("[INFO] Command timed out, assuming syntax is correct enough.\n")
         return True
@@ -138,12 +585,13 @@ def syntax_check_cli(cmd: str, timeout_secs: int = 2) -> bool:
         return False
 
 
-def get_user_commands_with_syntax_check(question_id=None) -> list:
+def get_user_commands_with_syntax_check(special_handling=None) -> list:
     """
     Prompt user for multiple commands (one per line). Press Enter on blank line to finish.
     - If line has `--help`, run it immediately, skip storing.
     - For kubectl/kubeadm/bash commands, do syntax check.
     - Handle special cases (e.g., Q10 mock output).
+    - With piped (non-TTY) input, failed checks are kept without the retry prompt.
     Return list of validated commands.
     """
     validated_commands = []
@@ -151,21 +599,40 @@ def get_user_commands_with_syntax_check(question_id=None) -> list:
         "Enter commands below (one per line). Press Enter on a blank line to finish.\n"
     )
 
+    # Piped input: read this question's lines up front so their syntax
+    # checks can run in parallel before the lines are handled in order
+    pending = None
+    timed_out = frozenset()
+    if not sys.stdin.isatty():
+        block = []
+        while True:
+            line = sys.stdin.readline().strip()
+            if not line:
+                break
+            block.append(line)
+        timed_out = _prefetch_syntax_checks(block)
+        pending = iter(block)
+
     while True:
-        line = input("> ").strip()
+        if pending is None:
+            line = input("> ").strip()
+        else:
+            print("> ", end="", flush=True)
+            line = next(pending, "")
         if not line:  # blank line => done
             break
 
         # Normalize 'k' => 'kubectl'
         line = canonicalize_kubectl(line)
 
-        # Handle Q10 mock output immediately if needed
-        if question_id == "q10":
-            special_mock_output_q10(line)
+        # Question-specific handler (e.g. Q10 mock output), run per line
+        if special_handling is not None:
+            special_handling(line)
 
-        # Handle help commands
-        if "--help" in line:
-            run_help_command(line)
+        # Handle help commands (match the flag as a token, not a substring)
+        tokens = _split_command(line)  # split once, shared by the helpers below
+        if "--help" in tokens:
+            run_help_command(line, tokens)
             continue
 
         # Skip syntax checks for etcdctl commands
@@ -174,12 +641,17 @@ def get_user_commands_with_syntax_check(question_id=None) -> list:
             continue
 
         # Syntax check for supported CLI commands
-        lower_line = line.lower()
-        if lower_line.startswith(("kubectl", "kubeadm", "apt-get", "systemctl")):
-            is_ok = syntax_check_cli(line)
+        if tokens and tokens[0].lower() in _CHECKED_COMMANDS:
+            is_ok = syntax_check_cli(line, tokens=tokens, timed_out=timed_out)
             if not is_ok:
                 print("It seems there's a syntax or usage error.\n")
-                retry = input("Would you like to re-enter this command? (y/n) ").lower()
+                if not sys.stdin.isatty():
+                    # Scripted input: nobody can answer, keep the command
+                    validated_commands.append(line)
+                    continue
+                retry = input(
+                    "Would you like to re-enter this command? (y/n) "
+                ).lower()
                 if retry.startswith("y"):
                     continue
             validated_commands.append(line)
@@ -190,17 +662,26 @@ def get_user_commands_with_syntax_check(question_id=None) -> list:
     return validated_commands
 
 
-def check_against_checklist(final_answer: str, checklist: list):
+def check_against_checklist(final_answer: str, checklist: list, checklist_folded=None):
     """
     Compare the user's final answer to the question's checklist.
-    Returns (found, missing) items based on a simple substring match.
+    Returns (found, missing) items based on a simple substring match,
+    ignoring case (str.casefold). Pass checklist_folded (the items already
+    case-folded) to skip folding them again on every call.
     """
+    # Nothing was entered (blank answer): everything is missing
+    if not final_answer.strip():
+        return [], list(checklist)
+
+    user_folded = final_answer.casefold()
+
     found = []
     missing = []
-    user_lower = final_answer.lower()
+    if checklist_folded is None:
+        checklist_folded = [item.casefold() for item in checklist]
 
-    for item in checklist:
-        if item.lower() in user_lower:
+    for item, item_folded in zip(checklist, checklist_folded):
+        if item_folded in user_folded:
             found.append(item)
         else:
             missing.append(item)
@@ -219,30 +700,19 @@ def special_mock_output_q10(user_answer: str):
 
     # Handle raw 'kubectl get nodes' without pipes
     if "kubectl get nodes" in commands[0] and len(commands) == 1:
-        print(
-            "[MOCK OUTPUT] You might be missing pipes or filters. Example raw output:\n"
-        )
-        print("NAME         STATUS     ROLES    AGE   VERSION")
-        print("k8s-master   Ready      master   12d   v1.19.0")
-        print("wk8s-node-0  NotReady   <none>   11d   v1.19.0\n")
+        sys.stdout.write(_Q10_RAW_NODES)
 
     # Handle pipe with 'grep -i ready'
     elif len(commands) > 1 and "grep -i ready" in commands[1]:
-        print("[MOCK OUTPUT] Example filtered output:\n")
-        print("NAME         STATUS     ROLES    AGE   VERSION")
-        print("k8s-master   Ready      master   12d   v1.19.0\n")
+        sys.stdout.write(_Q10_FILTERED_NODES)
 
     # Missing 'grep -i ready' but has 'kubectl get nodes'
     elif "kubectl get nodes" in commands[0] and "grep -i ready" not in user_lower:
-        print("[MOCK OUTPUT] Missing '| grep -i ready'. Example output:\n")
-        print("NAME         STATUS     ROLES    AGE   VERSION")
-        print("k8s-master   Ready      master   12d   v1.19.0")
-        print("wk8s-node-0  NotReady   <none>   11d   v1.19.0\n")
+        sys.stdout.write(_Q10_MISSING_READY)
 
     # Missing 'grep -i noschedule' after describing nodes
     elif (
         "kubectl describe nodes" in commands[0]
         and "grep -i noschedule" not in user_lower
     ):
-        print("[MOCK OUTPUT] Missing '| grep -i noSchedule'. Example taints:\n")
-        print("Taints: node-role.kubernetes.io/master:NoSchedule\n")
+        sys.stdout.write(_Q10_MISSING_NOSCHED)